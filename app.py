@@ -9,7 +9,32 @@ from datetime import datetime, date
 import plotly.express as px
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+from plotly_resampler import FigureResampler
+from plotly_resampler.aggregation import NoGapHandler
+import openpyxl
 import io
+import math
+
+# Metals tracked by the dashboard; array-valued state is aligned with this order
+METALS = ('gold', 'silver', 'platinum', 'palladium')
+
+# Columns of a price history record
+HISTORY_COLUMNS = ('date', *METALS)
+
+# Default prices ($/oz), aligned with METALS
+DEFAULT_PRICES = (2000.00, 25.00, 950.00, 1800.00)
+
+# Maximum number of points per chart trace sent to the browser
+CHART_MAX_POINTS = 1000
+
+# Chart line color and (row, col) subplot position for each metal
+_METAL_COLORS = {
+    'gold': '#FFD700',
+    'silver': '#C0C0C0',
+    'platinum': '#E5E4E2',
+    'palladium': '#CED0DD'
+}
+_SUBPLOT_POS = (('gold', 1, 1), ('silver', 1, 2), ('platinum', 2, 1), ('palladium', 2, 2))
 
 # Configure page
 st.set_page_config(
@@ -19,9 +44,8 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-def load_custom_css():
-    """Load custom CSS for better styling"""
-    st.markdown("""
+# Static HTML/CSS, built once at import instead of on every rerun
+_CSS = """
     <style>
         .metric-container {
             background-color: #f0f2f6;
@@ -93,260 +117,212 @@ def load_custom_css():
             margin: 1rem 0;
         }
     </style>
-    """, unsafe_allow_html=True)
+    """
+
+_HEADER_HTML = """
+    <div class="header-container">
+        <h1>🥇 Metal Prices Dashboard</h1>
+        <p style="font-size: 1.2em; margin: 0;">Real-time precious metals pricing interface</p>
+        <p style="font-size: 0.9em; margin-top: 10px; opacity: 0.8;">Upload Excel files with prices in D4-D7 or enter manually</p>
+    </div>
+    """
+
+_FOOTER_HTML = """
+    <div style="text-align: center; color: #666; padding: 20px;">
+        <p>💡 <strong>Tip:</strong> Upload an Excel file with prices in cells D4-D7, or manually enter prices above.</p>
+        <p>📈 Click 'Update Price History' to track changes over time.</p>
+        <p>🔗 <strong>GitHub:</strong> <a href="https://github.com" target="_blank">View Source Code</a></p>
+    </div>
+    """
+
+def load_custom_css():
+    """Load custom CSS for better styling"""
+    st.markdown(_CSS, unsafe_allow_html=True)
+
+def _history_record(day, prices):
+    """Build a price history record for a day from a METALS-aligned price array"""
+    return dict(zip(HISTORY_COLUMNS, [day, *prices.tolist()]))
+
+def _make_chart_template():
+    """Build the empty, styled four-subplot layout for the price history chart"""
+    fig = make_subplots(
+        rows=2, cols=2,
+        subplot_titles=('🥇 Gold ($/oz)', '🥈 Silver ($/oz)', '⚪ Platinum ($/oz)', '⚫ Palladium ($/oz)'),
+        vertical_spacing=0.12,
+        horizontal_spacing=0.1
+    )
+    
+    fig.update_layout(
+        height=600,
+        showlegend=False,
+        title_text="📈 Metal Price History",
+        title_x=0.5,
+        title_font_size=20,
+        plot_bgcolor='white'
+    )
+    
+    return fig
 
 def initialize_session_state():
     """Initialize session state variables"""
-    if 'metal_prices' not in st.session_state:
-        st.session_state.metal_prices = {
-            'gold': 2000.00,
-            'silver': 25.00,
-            'platinum': 950.00,
-            'palladium': 1800.00
-        }
+    # Prices ($/oz) and holdings (oz) are float arrays aligned with METALS
+    if 'prices' not in st.session_state:
+        st.session_state.prices = np.array(DEFAULT_PRICES)
+    
+    if 'holdings' not in st.session_state:
+        st.session_state.holdings = np.zeros(len(METALS))
     
     if 'price_history' not in st.session_state:
-        st.session_state.price_history = pd.DataFrame({
-            'date': [datetime.now().date()],
-            'gold': [st.session_state.metal_prices['gold']],
-            'silver': [st.session_state.metal_prices['silver']],
-            'platinum': [st.session_state.metal_prices['platinum']],
-            'palladium': [st.session_state.metal_prices['palladium']]
-        })
-    
-    if 'portfolio_holdings' not in st.session_state:
-        st.session_state.portfolio_holdings = {
-            'gold': 0.0,
-            'silver': 0.0,
-            'platinum': 0.0,
-            'palladium': 0.0
-        }
-
-def load_prices_from_excel(uploaded_file):
-    """Load prices from uploaded Excel file from cells D4-D7"""
+        # History is kept as a list of records; DataFrames are built on demand
+        today = datetime.now().date()
+        st.session_state.price_history = [_history_record(today, st.session_state.prices)]
+        # Position of each date's record in price_history, for O(1) lookups
+        st.session_state.date_to_idx = {today: 0}
+    
+    if '_chart_template' not in st.session_state:
+        # Subplot layout is built once per session and reused for every chart
+        st.session_state._chart_template = _make_chart_template()
+
+@st.cache_data(show_spinner=False)
+def _parse_prices_bytes(file_bytes):
+    """Parse prices from cells D4-D7 of raw Excel bytes (cached per file content)"""
     try:
-        # Read Excel file
-        df = pd.read_excel(uploaded_file, header=None)
+        # Read only cells D4:D7 instead of materializing the whole sheet
+        wb = openpyxl.load_workbook(io.BytesIO(file_bytes), read_only=True, data_only=True)
+        ws = wb.active
+        vals = [ws[cell].value for cell in ('D4', 'D5', 'D6', 'D7')]
+        wb.close()
         
-        # Check if file has enough rows and columns
-        if df.shape[0] >= 7 and df.shape[1] >= 4:
-            # Extract prices from D4:D7 (row indices 3-6, column index 3)
-            prices = {}
-            
-            # D4 - Gold
-            if pd.notna(df.iloc[3, 3]):
-                prices['gold'] = float(df.iloc[3, 3])
-            
-            # D5 - Silver  
-            if pd.notna(df.iloc[4, 3]):
-                prices['silver'] = float(df.iloc[4, 3])
+        # D4 - Gold, D5 - Silver, D6 - Platinum, D7 - Palladium
+        prices = {}
+        for metal, val in zip(METALS, vals):
+            if isinstance(val, (int, float)) and not isinstance(val, bool):
+                price = float(val)
+            elif isinstance(val, str):
+                # Numbers stored as text; anything else is treated as empty
+                try:
+                    price = float(val)
+                except ValueError:
+                    continue
+            else:
+                continue
             
-            # D6 - Platinum
-            if pd.notna(df.iloc[5, 3]):
-                prices['platinum'] = float(df.iloc[5, 3])
-            
-            # D7 - Palladium
-            if pd.notna(df.iloc[6, 3]):
-                prices['palladium'] = float(df.iloc[6, 3])
-            
-            return prices, None
-        else:
-            return None, "Excel file doesn't have enough rows/columns to read from D4:D7"
+            # "nan"/"inf" text parses as a float but is not a usable price
+            if math.isfinite(price):
+                prices[metal] = price
+        
+        if not prices:
+            return None, "Excel file doesn't have any prices in D4:D7"
+        return prices, None
             
     except Exception as e:
         return None, f"Error reading Excel file: {str(e)}"
 
+def load_prices_from_excel(uploaded_file):
+    """Load prices from uploaded Excel file from cells D4-D7"""
+    # Pass raw bytes so unchanged uploads hit the cache on every rerun
+    return _parse_prices_bytes(uploaded_file.getvalue())
+
 def update_price_history():
     """Add current prices to history"""
     today = datetime.now().date()
-    current_prices = st.session_state.metal_prices
-    
-    # Check if today already exists in history
-    if today not in st.session_state.price_history['date'].values:
-        new_row = pd.DataFrame({
-            'date': [today],
-            'gold': [current_prices['gold']],
-            'silver': [current_prices['silver']],
-            'platinum': [current_prices['platinum']],
-            'palladium': [current_prices['palladium']]
-        })
-        st.session_state.price_history = pd.concat([st.session_state.price_history, new_row], ignore_index=True)
-    else:
-        # Update existing row for today
-        mask = st.session_state.price_history['date'] == today
-        for metal in ['gold', 'silver', 'platinum', 'palladium']:
-            st.session_state.price_history.loc[mask, metal] = current_prices[metal]
-
-def create_price_chart():
-    """Create an interactive price history chart"""
-    df = st.session_state.price_history.copy()
-    df = df.sort_values('date')
     
-    if len(df) <= 1:
-        st.info("📈 Add more price history entries to see the chart!")
-        return None
+    idx = st.session_state.date_to_idx.get(today)
     
-    fig = make_subplots(
-        rows=2, cols=2,
-        subplot_titles=('🥇 Gold ($/oz)', '🥈 Silver ($/oz)', '⚪ Platinum ($/oz)', '⚫ Palladium ($/oz)'),
-        vertical_spacing=0.12,
-        horizontal_spacing=0.1
+    if idx is not None:
+        # Update today's entry in place
+        st.session_state.price_history[idx].update(zip(METALS, st.session_state.prices.tolist()))
+    else:
+        st.session_state.date_to_idx[today] = len(st.session_state.price_history)
+        st.session_state.price_history.append(_history_record(today, st.session_state.prices))
+
+@st.cache_data(show_spinner=False)
+def _history_csv(records):
+    """Serialize price history records to CSV (cached per history content)"""
+    return pd.DataFrame([dict(record) for record in records]).to_csv(index=False)
+
+@st.cache_data(show_spinner=False, max_entries=32)
+def _build_chart(rows, _template):
+    """Build the price history figure (cached per history content)"""
+    # Records are appended in date order, so sorting is normally unnecessary
+    df = pd.DataFrame(list(rows), columns=HISTORY_COLUMNS)
+    if not df['date'].is_monotonic_increasing:
+        df = df.sort_values('date')
+    
+    # Downsample long histories (LTTB) so each trace sends at most
+    # CHART_MAX_POINTS points to the browser
+    # (the template is copied, never modified). Streamlit only renders this
+    # static view: without a Dash callback server, zooming in does not fetch
+    # more detail.
+    fig = FigureResampler(
+        _template,
+        default_n_shown_samples=CHART_MAX_POINTS,
+        # History has one point per updated day, so irregular spacing is
+        # normal; keep each line continuous instead of splitting at gaps
+        default_gap_handler=NoGapHandler(),
+        # Keep trace names plain; the hover label shows them
+        resampled_trace_prefix_suffix=('', ''),
+        show_mean_aggregation_size=False
     )
     
-    # Define colors for each metal
-    colors = {
-        'gold': '#FFD700',
-        'silver': '#C0C0C0', 
-        'platinum': '#E5E4E2',
-        'palladium': '#CED0DD'
-    }
-    
-    metals = ['gold', 'silver', 'platinum', 'palladium']
-    positions = [(1,1), (1,2), (2,1), (2,2)]
-    
-    for metal, (row, col) in zip(metals, positions):
+    for metal, row, col in _SUBPLOT_POS:
         fig.add_trace(
-            go.Scatter(
-                x=df['date'], 
-                y=df[metal],
+            go.Scattergl(
                 name=metal.capitalize(),
-                line=dict(color=colors[metal], width=3),
+                line=dict(color=_METAL_COLORS[metal], width=3),
                 mode='lines+markers',
-                marker=dict(size=8),
-                hovertemplate=f'<b>{metal.capitalize()}</b><br>Date: %{{x}}<br>Price: $%{{y:,.2f}}<extra></extra>'
+                marker=dict(size=8)
             ),
+            hf_x=df['date'],
+            hf_y=df[metal],
             row=row, col=col
         )
     
-    fig.update_layout(
-        height=600,
-        showlegend=False,
-        title_text="📈 Metal Price History",
-        title_x=0.5,
-        title_font_size=20,
-        plot_bgcolor='white'
-    )
+    # One shared hover template; the metal name is filled in client-side
+    fig.update_traces(hovertemplate='<b>%{fullData.name}</b><br>Date: %{x}<br>Price: $%{y:,.2f}<extra></extra>')
     
     return fig
 
-def calculate_portfolio_value():
-    """Calculate and display portfolio value"""
-    holdings = st.session_state.portfolio_holdings
-    prices = st.session_state.metal_prices
+def create_price_chart():
+    """Create an interactive price history chart"""
+    history = st.session_state.price_history
     
-    total_value = 0
-    portfolio_breakdown = []
+    if len(history) <= 1:
+        st.info("📈 Add more price history entries to see the chart!")
+        return None
     
-    for metal in ['gold', 'silver', 'platinum', 'palladium']:
-        holding = holdings[metal]
-        price = prices[metal]
-        value = holding * price
-        total_value += value
-        
-        if holding > 0:
-            portfolio_breakdown.append({
-                'Metal': metal.capitalize(),
-                'Holdings (oz)': holding,
-                'Price ($/oz)': price,
-                'Value ($)': value
-            })
+    # The cache is shared by all sessions, so key it on the full history
+    # content (one row per day, cheap to hash)
+    rows = tuple(tuple(record.values()) for record in history)
+    return _build_chart(rows, st.session_state._chart_template)
+
+def calculate_portfolio_value():
+    """Calculate and display portfolio value"""
+    holdings = st.session_state.holdings
+    prices = st.session_state.prices
+    
+    values = prices * holdings
+    total_value = float(values.sum())
+    
+    portfolio_breakdown = [
+        {
+            'Metal': METALS[i].capitalize(),
+            'Holdings (oz)': float(holdings[i]),
+            'Price ($/oz)': float(prices[i]),
+            'Value ($)': float(values[i])
+        }
+        for i in np.flatnonzero(holdings > 0)
+    ]
     
     return total_value, portfolio_breakdown
 
-def main():
-    # Load custom CSS
-    load_custom_css()
-    
-    # Initialize session state
-    initialize_session_state()
-    
-    # Header with styling
-    st.markdown("""
-    <div class="header-container">
-        <h1>🥇 Metal Prices Dashboard</h1>
-        <p style="font-size: 1.2em; margin: 0;">Real-time precious metals pricing interface</p>
-        <p style="font-size: 0.9em; margin-top: 10px; opacity: 0.8;">Upload Excel files with prices in D4-D7 or enter manually</p>
-    </div>
-    """, unsafe_allow_html=True)
-    
-    # Sidebar for file upload and controls
-    with st.sidebar:
-        st.header("⚙️ Controls")
-        
-        # File upload section
-        st.subheader("📁 Load from Excel")
-        st.markdown("""
-        Upload an Excel file with prices in cells:
-        - **D4**: Gold price
-        - **D5**: Silver price  
-        - **D6**: Platinum price
-        - **D7**: Palladium price
-        """)
-        
-        uploaded_file = st.file_uploader(
-            "Choose Excel file", 
-            type=['xlsx', 'xls'],
-            help="Upload Excel file with metal prices in D4:D7"
-        )
-        
-        if uploaded_file is not None:
-            prices, error = load_prices_from_excel(uploaded_file)
-            
-            if prices:
-                # Update session state with loaded prices
-                st.session_state.metal_prices.update(prices)
-                
-                st.success("✅ Prices loaded successfully!")
-                st.markdown("**Loaded prices:**")
-                for metal, price in prices.items():
-                    st.write(f"• {metal.capitalize()}: ${price:,.2f}")
-                
-            elif error:
-                st.error(f"❌ {error}")
-        
-        st.markdown("---")
-        
-        # Quick actions
-        st.subheader("🎯 Quick Actions")
-        
-        if st.button("📊 Update Price History", type="primary", use_container_width=True):
-            update_price_history()
-            st.success("✅ Price history updated!")
-            st.rerun()
-        
-        if st.button("🔄 Reset All Prices", use_container_width=True):
-            st.session_state.metal_prices = {
-                'gold': 2000.00,
-                'silver': 25.00,
-                'platinum': 950.00,
-                'palladium': 1800.00
-            }
-            st.success("✅ Prices reset to defaults!")
-            st.rerun()
-        
-        if st.button("🗑️ Clear History", use_container_width=True):
-            st.session_state.price_history = pd.DataFrame({
-                'date': [datetime.now().date()],
-                'gold': [st.session_state.metal_prices['gold']],
-                'silver': [st.session_state.metal_prices['silver']],
-                'platinum': [st.session_state.metal_prices['platinum']],
-                'palladium': [st.session_state.metal_prices['palladium']]
-            })
-            st.success("✅ History cleared!")
-            st.rerun()
-        
-        # App info
-        st.markdown("---")
-        st.markdown("""
-        **📱 App Info:**
-        - Version: 1.0.0
-        - Built with Streamlit
-        - Hosted on Streamlit Cloud
-        """)
-    
-    # Main content area - Current Prices
-    st.header("💰 Current Metal Prices")
-    
+def _mark_prices_changed():
+    """Flag a user edit of a price input"""
+    st.session_state._prices_changed = True
+
+@st.fragment
+def _price_inputs():
+    """Price input widgets; edits rerun only this fragment"""
     # Create input fields for prices
     col1, col2, col3, col4 = st.columns(4)
     
@@ -355,10 +331,11 @@ def main():
         gold_price = st.number_input(
             "🥇 Gold ($/oz)",
             min_value=0.01,
-            value=st.session_state.metal_prices['gold'],
+            value=float(st.session_state.prices[0]),
             step=0.01,
             format="%.2f",
-            key="gold_input"
+            key="gold_input",
+            on_change=_mark_prices_changed
         )
         st.markdown(f'<p class="big-font">${gold_price:,.2f}</p>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
@@ -368,10 +345,11 @@ def main():
         silver_price = st.number_input(
             "🥈 Silver ($/oz)",
             min_value=0.01,
-            value=st.session_state.metal_prices['silver'],
+            value=float(st.session_state.prices[1]),
             step=0.01,
             format="%.2f",
-            key="silver_input"
+            key="silver_input",
+            on_change=_mark_prices_changed
         )
         st.markdown(f'<p class="big-font">${silver_price:,.2f}</p>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
@@ -381,10 +359,11 @@ def main():
         platinum_price = st.number_input(
             "⚪ Platinum ($/oz)",
             min_value=0.01,
-            value=st.session_state.metal_prices['platinum'],
+            value=float(st.session_state.prices[2]),
             step=0.01,
             format="%.2f",
-            key="platinum_input"
+            key="platinum_input",
+            on_change=_mark_prices_changed
         )
         st.markdown(f'<p class="big-font">${platinum_price:,.2f}</p>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
@@ -394,33 +373,26 @@ def main():
         palladium_price = st.number_input(
             "⚫ Palladium ($/oz)",
             min_value=0.01,
-            value=st.session_state.metal_prices['palladium'],
+            value=float(st.session_state.prices[3]),
             step=0.01,
             format="%.2f",
-            key="palladium_input"
+            key="palladium_input",
+            on_change=_mark_prices_changed
         )
         st.markdown(f'<p class="big-font">${palladium_price:,.2f}</p>', unsafe_allow_html=True)
         st.markdown('</div>', unsafe_allow_html=True)
     
     # Update session state when inputs change
-    st.session_state.metal_prices['gold'] = gold_price
-    st.session_state.metal_prices['silver'] = silver_price
-    st.session_state.metal_prices['platinum'] = platinum_price
-    st.session_state.metal_prices['palladium'] = palladium_price
-    
-    st.markdown("---")
-    
-    # Price History Chart
-    st.header("📈 Price History")
-    chart = create_price_chart()
-    if chart:
-        st.plotly_chart(chart, use_container_width=True)
-    
-    st.markdown("---")
-    
-    # Portfolio Calculator
-    st.header("📊 Portfolio Calculator")
+    st.session_state.prices[:] = [gold_price, silver_price, platinum_price, palladium_price]
     
+    # The portfolio value depends on prices, so an edit made while holdings
+    # are shown needs a full rerun rather than just this fragment
+    if st.session_state.pop('_prices_changed', False) and st.session_state.holdings.any():
+        st.rerun()
+
+@st.fragment
+def _portfolio_calculator():
+    """Holdings inputs and portfolio value; edits rerun only this fragment"""
     col1, col2 = st.columns([1, 1])
     
     with col1:
@@ -429,7 +401,7 @@ def main():
         gold_holding = st.number_input(
             "🥇 Gold Holdings (oz)",
             min_value=0.0,
-            value=st.session_state.portfolio_holdings['gold'],
+            value=float(st.session_state.holdings[0]),
             step=0.1,
             format="%.1f"
         )
@@ -437,7 +409,7 @@ def main():
         silver_holding = st.number_input(
             "🥈 Silver Holdings (oz)",
             min_value=0.0,
-            value=st.session_state.portfolio_holdings['silver'],
+            value=float(st.session_state.holdings[1]),
             step=0.1,
             format="%.1f"
         )
@@ -445,7 +417,7 @@ def main():
         platinum_holding = st.number_input(
             "⚪ Platinum Holdings (oz)",
             min_value=0.0,
-            value=st.session_state.portfolio_holdings['platinum'],
+            value=float(st.session_state.holdings[2]),
             step=0.1,
             format="%.1f"
         )
@@ -453,18 +425,13 @@ def main():
         palladium_holding = st.number_input(
             "⚫ Palladium Holdings (oz)",
             min_value=0.0,
-            value=st.session_state.portfolio_holdings['palladium'],
+            value=float(st.session_state.holdings[3]),
             step=0.1,
             format="%.1f"
         )
         
         # Update holdings in session state
-        st.session_state.portfolio_holdings = {
-            'gold': gold_holding,
-            'silver': silver_holding,
-            'platinum': platinum_holding,
-            'palladium': palladium_holding
-        }
+        st.session_state.holdings[:] = [gold_holding, silver_holding, platinum_holding, palladium_holding]
     
     with col2:
         st.subheader("Portfolio Value")
@@ -473,10 +440,17 @@ def main():
         
         if breakdown:
             df_portfolio = pd.DataFrame(breakdown)
-            df_portfolio['Value ($)'] = df_portfolio['Value ($)'].apply(lambda x: f"${x:,.2f}")
-            df_portfolio['Price ($/oz)'] = df_portfolio['Price ($/oz)'].apply(lambda x: f"${x:,.2f}")
             
-            st.dataframe(df_portfolio, use_container_width=True, hide_index=True)
+            # Keep numeric columns and let the frontend format the currency
+            st.dataframe(
+                df_portfolio,
+                column_config={
+                    'Value ($)': st.column_config.NumberColumn(format="$%.2f"),
+                    'Price ($/oz)': st.column_config.NumberColumn(format="$%.2f")
+                },
+                use_container_width=True,
+                hide_index=True
+            )
             
             # Portfolio summary
             st.markdown(f"""
@@ -487,6 +461,103 @@ def main():
             """, unsafe_allow_html=True)
         else:
             st.info("💡 Enter your metal holdings to see portfolio value.")
+
+def main():
+    # Load custom CSS
+    load_custom_css()
+    
+    # Initialize session state
+    initialize_session_state()
+    
+    # Header with styling
+    st.markdown(_HEADER_HTML, unsafe_allow_html=True)
+    
+    # Sidebar for file upload and controls
+    with st.sidebar:
+        st.header("⚙️ Controls")
+        
+        # File upload section
+        st.subheader("📁 Load from Excel")
+        st.markdown("""
+        Upload an Excel file with prices in cells:
+        - **D4**: Gold price
+        - **D5**: Silver price  
+        - **D6**: Platinum price
+        - **D7**: Palladium price
+        """)
+        
+        uploaded_file = st.file_uploader(
+            "Choose Excel file", 
+            type=['xlsx', 'xls'],
+            help="Upload Excel file with metal prices in D4:D7"
+        )
+        
+        if uploaded_file is not None:
+            prices, error = load_prices_from_excel(uploaded_file)
+            
+            if prices:
+                # Update session state with loaded prices
+                for metal, price in prices.items():
+                    st.session_state.prices[METALS.index(metal)] = price
+                
+                st.success("✅ Prices loaded successfully!")
+                st.markdown("**Loaded prices:**")
+                for metal, price in prices.items():
+                    st.write(f"• {metal.capitalize()}: ${price:,.2f}")
+                
+            elif error:
+                st.error(f"❌ {error}")
+        
+        st.markdown("---")
+        
+        # Quick actions
+        st.subheader("🎯 Quick Actions")
+        
+        if st.button("📊 Update Price History", type="primary", use_container_width=True):
+            update_price_history()
+            st.success("✅ Price history updated!")
+            st.rerun()
+        
+        if st.button("🔄 Reset All Prices", use_container_width=True):
+            st.session_state.prices = np.array(DEFAULT_PRICES)
+            st.success("✅ Prices reset to defaults!")
+            st.rerun()
+        
+        if st.button("🗑️ Clear History", use_container_width=True):
+            today = datetime.now().date()
+            st.session_state.price_history = [_history_record(today, st.session_state.prices)]
+            st.session_state.date_to_idx = {today: 0}
+            st.success("✅ History cleared!")
+            st.rerun()
+        
+        # App info
+        st.markdown("---")
+        st.markdown("""
+        **📱 App Info:**
+        - Version: 1.0.0
+        - Built with Streamlit
+        - Hosted on Streamlit Cloud
+        """)
+    
+    # Main content area - Current Prices
+    st.header("💰 Current Metal Prices")
+    
+    _price_inputs()
+    
+    st.markdown("---")
+    
+    # Price History Chart
+    st.header("📈 Price History")
+    chart = create_price_chart()
+    if chart:
+        st.plotly_chart(chart, use_container_width=True)
+    
+    st.markdown("---")
+    
+    # Portfolio Calculator
+    st.header("📊 Portfolio Calculator")
+    
+    _portfolio_calculator()
     
     st.markdown("---")
     
@@ -499,16 +570,17 @@ def main():
         if st.button("📋 Copy Current Prices", use_container_width=True):
             prices_text = "\n".join([
                 f"{metal.capitalize()}: ${price:,.2f}" 
-                for metal, price in st.session_state.metal_prices.items()
+                for metal, price in zip(METALS, st.session_state.prices)
             ])
             st.code(prices_text, language=None)
     
     with col2:
-        # Download price history
-        csv = st.session_state.price_history.to_csv(index=False)
+        # Download price history; the CSV is only built when the button is
+        # clicked, outside the script run, so capture the history here
+        history = st.session_state.price_history
         st.download_button(
             label="📊 Download Price History",
-            data=csv,
+            data=lambda: _history_csv(tuple(tuple(entry.items()) for entry in history)),
             file_name=f"metal_price_history_{datetime.now().strftime('%Y%m%d')}.csv",
             mime="text/csv",
             use_container_width=True
@@ -517,17 +589,11 @@ def main():
     with col3:
         if st.button("🔍 Show Raw Data", use_container_width=True):
             with st.expander("📋 Price History Data", expanded=True):
-                st.dataframe(st.session_state.price_history, use_container_width=True)
+                st.dataframe(pd.DataFrame(st.session_state.price_history), use_container_width=True)
     
     # Footer
     st.markdown("---")
-    st.markdown("""
-    <div style="text-align: center; color: #666; padding: 20px;">
-        <p>💡 <strong>Tip:</strong> Upload an Excel file with prices in cells D4-D7, or manually enter prices above.</p>
-        <p>📈 Click 'Update Price History' to track changes over time.</p>
-        <p>🔗 <strong>GitHub:</strong> <a href="https://github.com" target="_blank">View Source Code</a></p>
-    </div>
-    """, unsafe_allow_html=True)
+    st.markdown(_FOOTER_HTML, unsafe_allow_html=True)
 
 if __name__ == "__main__":
     main()
@@ -542,11 +608,12 @@ Create these files in your GitHub repository:
 
 1. requirements.txt
 -------------------
-streamlit>=1.28.0
+streamlit>=1.52.0
 pandas>=1.5.0
 plotly>=5.15.0
 openpyxl>=3.1.0
 numpy>=1.24.0
+plotly-resampler>=0.9.0
 
 2. README.md
 ------------
@@ -601,6 +668,7 @@ This app is deployed on Streamlit Community Cloud. Any changes pushed to the mai
 - **Streamlit**: Web app framework
 - **Pandas**: Data manipulation  
 - **Plotly**: Interactive charts
+- **plotly-resampler**: Downsampling of long price histories
 - **OpenPyXL**: Excel file processing
 
 ## Contributing